@@ -0,0 +1,162 @@
+"""Compare size and load time of raw and encoded saved game data."""
+
+import argparse
+import pickle
+import random
+import time
+
+import run
+
+
+def synthetic_games(count):
+    """Raw game data by name, shaped like statsapi feed/live responses."""
+    random.seed(count)
+    venue = {
+        'id': 3289,
+        'name': 'Citi Field',
+        'link': '/api/v1/venues/3289',
+        'location': {'city': 'Flushing', 'stateAbbrev': 'NY'},
+        'timeZone': {'tz': 'EDT'}
+    }
+    league = {'id': 104, 'name': 'National League', 'link': '/api/v1/league/104'}  # noqa:E501
+    people = {
+        t: [
+            {
+                'id': t * 1000 + x,
+                'fullName': f'Player {t} {x}',
+                'link': f'/api/v1/people/{t * 1000 + x}'
+            }
+            for x in range(26)
+        ]
+        for t in range(10)
+    }
+
+    def team(team_id):
+        return {
+            'id': team_id,
+            'name': f'Team {team_id}',
+            'link': f'/api/v1/teams/{team_id}',
+            'venue': dict(venue),
+            'league': dict(league),
+            'record': {'wins': random.randint(0, 90), 'losses': 40}
+        }
+
+    def box_score(team_id):
+        return {
+            'team': team(team_id),
+            'players': {
+                f"ID{x['id']}": {
+                    'person': dict(x),
+                    'position': {'abbreviation': 'CF'},
+                    'battingOrder': str(100 * (i + 1)),
+                    'stats': {'batting': {
+                        'atBats': random.randint(0, 5),
+                        'hits': random.randint(0, 3),
+                        'runs': 0,
+                        'rbi': 0,
+                        'baseOnBalls': 0,
+                        'strikeOuts': 1
+                    }},
+                    'seasonStats': {'batting': {
+                        'avg': f'.{random.randint(100, 350)}'
+                    }}
+                }
+                for i, x in enumerate(people[team_id])
+            }
+        }
+
+    def game(away, home):
+        plays = [
+            {
+                'about': {'isTopInning': not i % 2, 'inning': i // 2 + 1},
+                'matchup': {
+                    'batter': dict(random.choice(people[away])),
+                    'pitcher': dict(random.choice(people[home]))
+                },
+                'result': {'description': 'x' * random.randint(10, 80)}
+            }
+            for i in range(80)
+        ]
+        return {
+            '_status': 'final',
+            'gameData': {
+                'teams': {'away': team(away), 'home': team(home)},
+                'venue': dict(venue),
+                'players': {
+                    f"ID{x['id']}": dict(x, height='6\' 2"')
+                    for x in people[away] + people[home]
+                }
+            },
+            'liveData': {
+                'boxscore': {'teams': {
+                    'away': box_score(away),
+                    'home': box_score(home)
+                }},
+                'plays': {'allPlays': plays}
+            },
+            'broadcasts': []
+        }
+
+    return {
+        f'game-{x}': [game(x % 10, (x + 3) % 10)]
+        for x in range(count)
+    }
+
+
+def best_time(func, names, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for name in names:
+            func(name)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / max(len(names), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--synthetic',
+        type=int,
+        help='benchmark this many generated games instead of saved data')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='best of this many runs is reported')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        raw = synthetic_games(args.synthetic)
+    else:
+        (shared, games) = run._read_game_file()
+        raw = games if shared is None else {
+            k: run._decode_game_data(v, shared) for k, v in games.items()
+        }
+
+    shared = []
+    games = {k: run._encode_game_data(v, shared) for k, v in raw.items()}
+    raw_content = pickle.dumps(raw)
+    encoded_content = run._dump_game_file(shared, games)
+
+    def load(content, name):
+        (shared, games) = run._parse_game_file(content)
+        if shared is None:
+            return games[name]
+        return run._decode_game_data(games[name], shared)
+
+    for name in raw.keys():
+        assert load(encoded_content, name) == raw[name], f'{name} differs'
+
+    raw_time = best_time(
+        lambda x: load(raw_content, x), raw.keys(), args.repeat)
+    encoded_time = best_time(
+        lambda x: load(encoded_content, x), raw.keys(), args.repeat)
+    print(f'games: {len(raw)}, shared entities: {len(shared)}')
+    print(f'raw:     {len(raw_content):>10} bytes {raw_time * 1000:8.2f} ms/load')  # noqa:E501
+    print(f'encoded: {len(encoded_content):>10} bytes {encoded_time * 1000:8.2f} ms/load')  # noqa:E501
+    print(f'ratio:   {len(raw_content) / len(encoded_content):>10.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Asyncio HTTP engine for statsapi requests."""
+
+import asyncio
+
+import aiohttp
+
+# seconds before a single request is abandoned
+TIMEOUT = 10
+
+# max open connections per Fetcher
+CONNECTION_LIMIT = 100
+
+
+class FetchError(Exception):
+    """Request failed or missed its deadline."""
+
+
+class Fetcher:
+    """Concurrent JSON GET requests over one session.
+
+    Identical requests made while one is in flight share its response.
+    Each caller waits only as long as its own timeout, and the shared request
+    is cancelled once every caller waiting on it has given up.
+    """
+
+    def __init__(self, timeout=TIMEOUT, limit=CONNECTION_LIMIT):
+        self.timeout = timeout
+        self.limit = limit
+        self._session = None
+        self._in_flight = {}
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.limit)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def get_json(self, url, params=None, timeout=None):
+        """Parsed JSON body of url, raises FetchError after timeout seconds."""
+        key = (url, tuple(sorted((params or {}).items())))
+        request = self._in_flight.get(key)
+        if request is None:
+            task = asyncio.ensure_future(self._get_json(url, params))
+            request = self._in_flight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._forget(key, request))
+        task = request[0]
+
+        # shield so one caller giving up does not cancel the shared request
+        timeout = timeout or self.timeout
+        request[1] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise FetchError(f'{url} timed out after {timeout}s')
+        finally:
+            request[1] -= 1
+            if not request[1] and not task.done():
+                task.cancel()
+                self._forget(key, request)
+
+    def _forget(self, key, request):
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+
+    async def _get_json(self, url, params):
+        try:
+            async with self._session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            raise FetchError(f'{url} failed: {e}')
+        except ValueError as e:
+            raise FetchError(f'{url} returned invalid JSON: {e}')
+
+
+def run(main, *args):
+    """Blocking call of coroutine function main(fetcher, *args)."""
+    async def with_fetcher():
+        async with Fetcher() as fetcher:
+            return await main(fetcher, *args)
+    return asyncio.run(with_fetcher())
+
+
+def get_json(url, params=None, timeout=TIMEOUT):
+    """Blocking single JSON GET request."""
+    async def fetch(fetcher):
+        return await fetcher.get_json(url, params, timeout)
+    return run(fetch)
@@ -4,7 +4,7 @@
 import datetime
 import sys
 
-import requests
+import fetch
 
 year = sys.argv[1] if len(sys.argv) > 1 else datetime.datetime.now().year
 url = 'https://lookup-service-prod.mlb.com/json/named.team_all_season.bam'
@@ -12,8 +12,7 @@ params = {
     'sport_code': "'mlb'",
     'season': year
 }
-response = requests.get(url, params=params)
-data = response.json()
+data = fetch.get_json(url, params=params)
 teams = [
     {
         'id': x['team_id'],
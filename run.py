@@ -1,16 +1,19 @@
 """Terminal GameDay."""
 
 import argparse
+import asyncio
 import datetime
 import pickle
-
-import requests
+import zlib
 
 from rich import box
 from rich.align import Align
+from rich.cells import cell_len
 from rich.console import Console
+from rich.measure import Measurement
 from rich.table import Table
 
+import fetch
 from teams import TEAMS
 
 # markers for base runners and count
@@ -21,6 +24,14 @@ OFF = ':white_medium_square:'
 # file to save/load game data for offline access
 PICKLE_FILE = 'games.p'
 
+# saved game data encoding, bump when layout of PICKLE_FILE changes
+STORAGE_FORMAT = 1
+COMPRESS_LEVEL = 9
+
+# box score columns kept when the console is too narrow for all of them
+COMPACT_BATTING_COLUMNS = ['POS', 'Name', 'AB', 'H', 'R', 'RBI']
+COMPACT_PITCHING_COLUMNS = ['Name', 'IP', 'H', 'ER', 'SO']
+
 # groups of game status to determine output format
 GAME_STATUSES = {
     'pending': ['scheduled', 'pre-game', 'warmup', 'postponed', 'delayed start', 'cancelled'],  # noqa:E501
@@ -64,10 +75,11 @@ def main():
         if not _valid_status(game['_status']):
             exit(f"Invalid status {game['_status']}")
 
-    # generate rows of data from each game
+    # generate rows of data from each game, sized to the terminal
+    console = Console()
     final_rows = []
     for game in filtered_games:
-        final_rows += _game_rows(game)
+        final_rows += _game_rows(game, console)
 
     # add all rows in grid, centered
     grid = Table.grid()
@@ -75,7 +87,6 @@ def main():
         grid.add_row(Align.center(x))
 
     # print to console
-    console = Console()
     console.print(grid, justify='center')
 
     # warn if double-header but only showing one
@@ -104,9 +115,9 @@ def _select_games(select, games):
     return games
 
 
-def _game_rows(game_details):
+def _game_rows(game_details, console=None):
     summary = summary_table(game_details)
-    box_score = box_score_table(game_details)
+    box_score = box_score_table(game_details, console=console)
     broadcast = broadcast_table(game_details)
     probable_pitchers = probable_pitchers_table(game_details)
     (labels, innings, totals) = line_score_tables(game_details)
@@ -255,8 +266,13 @@ def probable_pitchers_table(game_details, table_format='fancy_grid'):
     return table
 
 
-def box_score_table(game_details, allow_empty=False):
-    """Table box score of both teams, hitting and pitching."""
+def box_score_table(game_details, allow_empty=False, console=None):
+    """Table box score of both teams, hitting and pitching.
+
+    Teams are side by side, or stacked when too wide for the console. When
+    one team alone is too wide, only compact columns and short names are
+    shown, and if those still do not fit the cells wrap.
+    """
     live_data = game_details['liveData']
     box_score = live_data['boxscore']
 
@@ -275,21 +291,46 @@ def box_score_table(game_details, allow_empty=False):
     if not allow_empty and not away_lineup and not home_lineup:
         return ''
 
+    def team_tables(**kwargs):
+        away = [
+            box_score_batting_table(away_lineup, batter_id, **kwargs),
+            box_score_pitching_table('away', live_data, **kwargs)
+        ]
+        home = [
+            box_score_batting_table(home_lineup, batter_id, **kwargs),
+            box_score_pitching_table('home', live_data, **kwargs)
+        ]
+        return (away, home)
+
+    (away, home) = team_tables()
+    if not _fits(console, [away, home]):
+        if not _fits(console, [away + home]):
+            (away, home) = team_tables(compact=True)
+        if not _fits(console, [away + home]):
+            (away, home) = team_tables(compact=True, fixed=False)
+        table = Table(show_lines=True, show_header=False)
+        table.add_column(justify='center')
+        for (team, tables) in [(away_team, away), (home_team, home)]:
+            table.add_row(team)
+            for x in tables:
+                table.add_row(Align.center(x))
+        return table
+
     table = Table(show_lines=True)
     table.add_column(away_team, justify='center')
     table.add_column(home_team, justify='center')
-    table.add_row(
-        Align.center(box_score_batting_table(away_lineup, batter_id)),
-        Align.center(box_score_batting_table(home_lineup, batter_id))
-    )
-    table.add_row(
-        Align.center(box_score_pitching_table('away', live_data)),
-        Align.center(box_score_pitching_table('home', live_data))
-    )
+    for (x, y) in zip(away, home):
+        table.add_row(Align.center(x), Align.center(y))
     return table
 
 
-def box_score_batting_table(lineup, current_batter, table_format='simple'):
+def box_score_batting_table(
+    lineup,
+    current_batter,
+    table_format='simple',
+    compact=False,
+    fixed=True
+):
     """Table of batting box score for one team."""
     def display_order(batter):
         batting_order = int(batter['battingOrder'])
@@ -299,13 +340,12 @@ def box_score_batting_table(lineup, current_batter, table_format='simple'):
 
     def player_name(batter, current_batter):
         modifier = '*' if batter['id'] == current_batter else ' '
-        return f"{modifier} {batter['fullName']}"
+        name = batter['fullName']
+        return f"{modifier} {_short_name(name) if compact else name}"
 
-    table = Table(box=box.SIMPLE)
-    for x in ['#', 'POS', 'Name', 'AB', 'H', 'R', 'RBI', 'BB', 'SO']:
-        table.add_column(x)
-    for x in lineup:
-        table.add_row(
+    headers = ['#', 'POS', 'Name', 'AB', 'H', 'R', 'RBI', 'BB', 'SO']
+    rows = [
+        (
             display_order(x),
             x['position']['abbreviation'],
             player_name(x['person'], current_batter),
@@ -316,10 +356,21 @@ def box_score_batting_table(lineup, current_batter, table_format='simple'):
             str(x['stats']['batting']['baseOnBalls']),
             str(x['stats']['batting']['strikeOuts'])
         )
-    return table
-
-
-def box_score_pitching_table(team, live_data, table_format='simple'):
+        for x in lineup
+    ]
+    if compact:
+        (headers, rows) = _select_columns(
+            headers, rows, COMPACT_BATTING_COLUMNS)
+    return _text_table(headers, rows, fixed, box=box.SIMPLE)
+
+
+def box_score_pitching_table(
+    team,
+    live_data,
+    table_format='simple',
+    compact=False,
+    fixed=True
+):
     """Table of pitching box score for one team."""
     # parse live events to find pitchers in game order
     plays = live_data['plays']['allPlays']
@@ -337,12 +388,11 @@ def box_score_pitching_table(team, live_data, table_format='simple'):
         for x in pitcher_ids
     ]
 
-    table = Table(box=box.SIMPLE)
-    for x in ['Name', 'IP', 'H', 'R', 'ER', 'BB', 'SO']:
-        table.add_column(x)
-    for x in pitchers:
-        table.add_row(
-            x['person']['fullName'],
+    headers = ['Name', 'IP', 'H', 'R', 'ER', 'BB', 'SO']
+    rows = [
+        (
+            _short_name(x['person']['fullName'])
+            if compact else x['person']['fullName'],
             str(x['stats']['pitching']['inningsPitched']),
             str(x['stats']['pitching']['hits']),
             str(x['stats']['pitching']['runs']),
@@ -350,9 +400,59 @@ def box_score_pitching_table(team, live_data, table_format='simple'):
             str(x['stats']['pitching']['baseOnBalls']),
             str(x['stats']['pitching']['strikeOuts'])
         )
+        for x in pitchers
+    ]
+    if compact:
+        (headers, rows) = _select_columns(
+            headers, rows, COMPACT_PITCHING_COLUMNS)
+    return _text_table(headers, rows, fixed, box=box.SIMPLE)
+
+
+def _text_table(headers, rows, fixed=True, **kwargs):
+    """Table of text cells, fixed columns are sized to their widest cell.
+
+    Rich skips measuring the cells of fixed width columns, so fitting the
+    table to the console no longer grows with the number of rows. Fixed
+    columns do not wrap, so only use them when the table fits.
+    """
+    table = Table(**kwargs)
+    for (i, header) in enumerate(headers):
+        if fixed:
+            width = max(cell_len(x[i]) for x in [headers] + rows)
+            table.add_column(header, width=width, no_wrap=True)
+        else:
+            table.add_column(header)
+    for x in rows:
+        table.add_row(*x)
     return table
 
 
+def _select_columns(headers, rows, keep):
+    """Headers and rows with only the columns named in keep."""
+    indexes = [headers.index(x) for x in keep]
+    return (list(keep), [tuple(x[i] for i in indexes) for x in rows])
+
+
+def _short_name(full_name):
+    """First initial and last name, `Pete Alonso` becomes `P. Alonso`."""
+    (first, _, last) = full_name.partition(' ')
+    return f'{first[0]}. {last}' if last else full_name
+
+
+def _fits(console, columns):
+    """Whether stacks of tables fit next to each other in the console."""
+    if console is None:
+        return True
+    width = console.width
+
+    # outer table has a border around each column and padding either side
+    needed = len(columns) * 3 + 1 + sum(
+        max(Measurement.get(console, x, width).maximum for x in tables)
+        for tables in columns
+    )
+    return needed <= width
+
+
 def line_score_tables(game_details, table_format='fancy_grid'):
     """Table for top per-inning score."""
     live_data = game_details['liveData']
@@ -551,6 +651,13 @@ def _find_team(term):
 
 
 def _find_games(day, team_id):
+    try:
+        return fetch.run(_fetch_games, day, team_id)
+    except fetch.FetchError as e:
+        exit(f'Unable to reach statsapi: {e}')
+
+
+async def _fetch_games(fetcher, day, team_id):
     url = 'https://statsapi.mlb.com/api/v1/schedule'
     params = {
         'date': day,
@@ -559,19 +666,21 @@ def _find_games(day, team_id):
         'teamId': team_id,
         'hydrate': 'broadcasts(all)'
     }
-    response = requests.get(url, params=params)
-    data = response.json()
+    data = await fetcher.get_json(url, params=params)
     dates = data.get('dates', [])
     if not dates:
         return []
-    return [_find_game_details(x) for x in dates[0]['games']]
+    return await asyncio.gather(*[
+        _find_game_details(fetcher, x)
+        for x in dates[0]['games']
+    ])
 
 
-def _find_game_details(game):
+async def _find_game_details(fetcher, game):
     game_id = game['gamePk']
     url = f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live'
-    response = requests.get(url)
-    details = response.json()
+    # copy, coalesced requests for a repeated gamePk share one response
+    details = dict(await fetcher.get_json(url))
     details['_status'] = details['gameData']['status']['detailedState'].lower()  # noqa:E501
     details['broadcasts'] = [
         x
@@ -582,30 +691,119 @@ def _find_game_details(game):
 
 
 def _save_game_data(name, data):
-    games = pickle.load(open(PICKLE_FILE, 'rb'))
+    (shared, games) = _read_encoded_game_file()
     if name in games:
         exit(f'Game named "{name}" already exists in saved data!')
-    games[name] = data
-    pickle.dump(games, open(PICKLE_FILE, 'wb'))
+    games[name] = _encode_game_data(data, shared)
+    _write_game_file(shared, games)
 
 
 def _load_game_data(name):
-    games = pickle.load(open(PICKLE_FILE, 'rb'))
+    (shared, games) = _read_game_file()
     if name not in games:
         print('\n'.join([x for x in games.keys()]))
         if name:
             exit(f'Unable to find game named "{name}" in saved data!')
         else:
             exit()
-    return games[name]
+    if shared is None:
+        return games[name]
+    return _decode_game_data(games[name], shared)
 
 
 def _delete_game_data(name):
-    games = pickle.load(open(PICKLE_FILE, 'rb'))
+    (shared, games) = _read_encoded_game_file()
     if name not in games:
         exit(f'Unable to find game named "{name}" in saved data!')
     del games[name]
-    pickle.dump(games, open(PICKLE_FILE, 'wb'))
+
+    # re-encode remaining games to drop entries only the deleted game used
+    decoded = {k: _decode_game_data(v, shared) for k, v in games.items()}
+    shared = []
+    games = {k: _encode_game_data(v, shared) for k, v in decoded.items()}
+    _write_game_file(shared, games)
+
+
+def _read_game_file():
+    """Shared entity table and encoded games by name from PICKLE_FILE."""
+    return _parse_game_file(open(PICKLE_FILE, 'rb').read())
+
+
+def _read_encoded_game_file():
+    """Same as _read_game_file, encoding files from before STORAGE_FORMAT."""
+    (shared, games) = _read_game_file()
+    if shared is None:
+        shared = []
+        games = {k: _encode_game_data(v, shared) for k, v in games.items()}
+    return (shared, games)
+
+
+def _write_game_file(shared, games):
+    """Write shared entity table and encoded games to PICKLE_FILE."""
+    open(PICKLE_FILE, 'wb').write(_dump_game_file(shared, games))
+
+
+def _parse_game_file(content):
+    """Shared entity table and encoded games by name from file content.
+
+    Files from before STORAGE_FORMAT hold raw game data by name, these are
+    returned as is with shared set to None.
+    """
+    data = pickle.loads(content)
+    if isinstance(data, dict):
+        return (None, data)
+
+    (version, shared, games) = data
+    if version != STORAGE_FORMAT:
+        exit(f'Saved data is format {version}, expected {STORAGE_FORMAT}!')
+    return (pickle.loads(zlib.decompress(shared)), games)
+
+
+def _dump_game_file(shared, games):
+    """File content for shared entity table and encoded games by name."""
+    shared = zlib.compress(pickle.dumps(shared), COMPRESS_LEVEL)
+    return pickle.dumps((STORAGE_FORMAT, shared, games))
+
+
+def _encode_game_data(data, shared):
+    """Compressed game data with statsapi entities interned in shared.
+
+    Any dict with an `id` and `link` (people, teams, venues, leagues...) is
+    appended to shared once and replaced by a `(index,)` reference. JSON
+    never produces tuples, so references cannot collide with real data.
+    """
+    # repr keeps key order and tells 1, 1.0 and True apart, unlike ==
+    index = {repr(x): i for i, x in enumerate(shared)}
+
+    def encode(obj):
+        if isinstance(obj, list):
+            return [encode(x) for x in obj]
+        if not isinstance(obj, dict):
+            return obj
+        obj = {k: encode(v) for k, v in obj.items()}
+        if 'id' not in obj or 'link' not in obj:
+            return obj
+        key = repr(obj)
+        if key not in index:
+            index[key] = len(shared)
+            shared.append(obj)
+        return (index[key],)
+
+    return zlib.compress(pickle.dumps(encode(data)), COMPRESS_LEVEL)
+
+
+def _decode_game_data(record, shared):
+    """Rebuild exact game data from output of _encode_game_data."""
+    def decode(obj):
+        if isinstance(obj, tuple):
+            return decode(shared[obj[0]])
+        if isinstance(obj, list):
+            return [decode(x) for x in obj]
+        if isinstance(obj, dict):
+            return {k: decode(v) for k, v in obj.items()}
+        return obj
+
+    return decode(pickle.loads(zlib.decompress(record)))
 
 
 def _load_args():